@@ -3,9 +3,12 @@ Database Helper Functions
 
 MongoDB helper functions ready to use in your backend code.
 Import and use these functions in your API endpoints for database operations.
+
+The client is an async Motor client created once by the application lifespan
+(see `connect` / `close`), so every helper here is a coroutine and must be awaited.
 """
 
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import datetime, timezone
 import os
 from dotenv import load_dotenv
@@ -18,15 +21,40 @@ load_dotenv()
 _client = None
 db = None
 
+# Collection handles bound once in connect(); use these instead of db["..."] in handlers
+teams = None
+tournaments = None
+matches = None
+standings = None
+
 database_url = os.getenv("DATABASE_URL")
 database_name = os.getenv("DATABASE_NAME")
 
-if database_url and database_name:
-    _client = MongoClient(database_url)
-    db = _client[database_name]
+
+def connect():
+    """Create the shared Motor client (called once from the app lifespan)"""
+    global _client, db, teams, tournaments, matches, standings
+    if _client is None and database_url and database_name:
+        _client = AsyncIOMotorClient(database_url, minPoolSize=5, maxPoolSize=20, serverSelectionTimeoutMS=5000)
+        db = _client[database_name]
+        teams = db["team"]
+        tournaments = db["tournament"]
+        matches = db["match"]
+        standings = db["standings"]
+    return db
+
+
+def close():
+    """Close the shared Motor client"""
+    global _client, db, teams, tournaments, matches, standings
+    if _client is not None:
+        _client.close()
+    _client = None
+    db = teams = tournaments = matches = standings = None
+
 
 # Helper functions for common database operations
-def create_document(collection_name: str, data: Union[BaseModel, dict]):
+async def create_document(collection_name: str, data: Union[BaseModel, dict]):
     """Insert a single document with timestamp"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
@@ -40,16 +68,32 @@ def create_document(collection_name: str, data: Union[BaseModel, dict]):
     data_dict['created_at'] = datetime.now(timezone.utc)
     data_dict['updated_at'] = datetime.now(timezone.utc)
 
-    result = db[collection_name].insert_one(data_dict)
+    result = await db[collection_name].insert_one(data_dict)
     return str(result.inserted_id)
 
-def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
+async def create_documents(collection_name: str, items: list):
+    """Insert many documents with timestamps in a single round-trip"""
+    if db is None:
+        raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
+
+    now = datetime.now(timezone.utc)
+    docs = [
+        {**(item.model_dump() if isinstance(item, BaseModel) else item), 'created_at': now, 'updated_at': now}
+        for item in items
+    ]
+    if not docs:
+        return []
+
+    result = await db[collection_name].insert_many(docs, ordered=False)
+    return [str(_id) for _id in result.inserted_ids]
+
+async def get_documents(collection_name: str, filter_dict: dict = None, limit: int = None):
     """Get documents from collection"""
     if db is None:
         raise Exception("Database not available. Check DATABASE_URL and DATABASE_NAME environment variables.")
-    
+
     cursor = db[collection_name].find(filter_dict or {})
     if limit:
         cursor = cursor.limit(limit)
-    
-    return list(cursor)
+
+    return await cursor.to_list(length=None)
@@ -1,21 +1,71 @@
+import asyncio
+import logging
 import os
+import re
+from datetime import datetime, timezone
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import numpy as np
+from cachetools import TTLCache
 from bson import ObjectId
+from pymongo import ReturnDocument, UpdateOne
+
+import database
+from database import create_document, create_documents, get_documents
+from schemas import Team, Player, Tournament
+
+logger = logging.getLogger(__name__)
+
+
+async def ensure_indexes():
+    # Idempotent; hot filters are match by tournament/status and standings by tournament.
+    # Each index is created on its own so one failure (e.g. duplicate standings rows
+    # blocking the unique index) neither skips the others nor stops the app starting.
+    indexes = [
+        (database.matches, [("tournament_id", 1), ("status", 1)], {}),
+        (database.matches, [("tournament_id", 1), ("standings_synced", 1)], {}),
+        (database.tournaments, [("team_ids", 1)], {}),
+        (database.standings, [("tournament_id", 1), ("team_id", 1)], {"unique": True}),
+    ]
+    for collection, keys, options in indexes:
+        try:
+            await collection.create_index(keys, **options)
+        except Exception as e:
+            logger.warning("Could not create index %s on %s: %s", keys, collection.name, e)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    db = database.connect()
+    if db is not None:
+        try:
+            # Open the first connection now so the first request doesn't pay for it
+            await db.command("ping")
+        except Exception as e:
+            logger.warning("Database not reachable at startup: %s", e)
+        else:
+            await ensure_indexes()
+    yield
+    database.close()
+
 
-from database import db, create_document, get_documents
-from schemas import Team, Player, Tournament, Match
+app = FastAPI(title="Football Tournament Manager API", lifespan=lifespan, default_response_class=ORJSONResponse)
 
-app = FastAPI(title="Football Tournament Manager API")
+# Comma-separated frontend origins, e.g. "https://app.example.com,http://localhost:5173".
+# Credentials are only allowed with an explicit list; a wildcard origin cannot carry them.
+allowed_origins = [o.strip() for o in os.getenv("ALLOWED_ORIGINS", "").split(",") if o.strip()]
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=allowed_origins or ["*"],
+    allow_credentials=bool(allowed_origins),
+    allow_methods=("GET", "POST", "OPTIONS"),
+    allow_headers=("Content-Type", "Authorization"),
 )
 
 
@@ -24,11 +74,48 @@ class IdResponse(BaseModel):
     id: str
 
 
+def stringify_ids(docs: List[dict]) -> List[dict]:
+    # Expose Mongo's _id as a string "id" field. List endpoints hand the result straight
+    # to ORJSONResponse (skipping jsonable_encoder), so no ObjectId may be left behind.
+    return [{"id": str(d.pop("_id")), **d} for d in docs]
+
+
+# Hot reads polled by live-scoring clients are single-flight: a request for a key whose
+# fetch is already running joins it, otherwise it starts the fetch immediately.
+_inflight: Dict[tuple, asyncio.Task] = {}
+
+
+def _finish_fetch(key: tuple, task: asyncio.Task):
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    # Retrieve the outcome so a failure nobody is waiting on any more isn't logged as unretrieved
+    if not task.cancelled():
+        task.exception()
+
+
+async def coalesce(key: tuple, fetch: Callable[[], Awaitable]):
+    task = _inflight.get(key)
+    if task is None:
+        task = _inflight[key] = asyncio.create_task(fetch())
+        task.add_done_callback(lambda t: _finish_fetch(key, t))
+    # Shielded so one client disconnecting doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
+
+_is_hex24 = re.compile(r"[0-9a-fA-F]{24}").fullmatch
+
+
 def oid(id_str: str) -> ObjectId:
-    try:
-        return ObjectId(id_str)
-    except Exception:
+    if not isinstance(id_str, str) or not _is_hex24(id_str):
+        raise HTTPException(status_code=400, detail="Invalid id format")
+    return ObjectId(id_str)
+
+
+def oids(id_strs: List[str]) -> List[ObjectId]:
+    # Reject the whole batch before constructing any ObjectId
+    if not all(isinstance(x, str) and _is_hex24(x) for x in id_strs):
         raise HTTPException(status_code=400, detail="Invalid id format")
+    return [ObjectId(x) for x in id_strs]
 
 
 @app.get("/")
@@ -36,8 +123,13 @@ def read_root():
     return {"message": "Football Tournament Manager Backend is running"}
 
 
+# Health checks poll /test; the collection set rarely changes, so the listing is cached
+# (a ping still runs on every hit so connection status is never stale)
+_collections_cache = TTLCache(maxsize=1, ttl=30)
+
+
 @app.get("/test")
-def test_database():
+async def test_database():
     response = {
         "backend": "✅ Running",
         "database": "❌ Not Available",
@@ -48,10 +140,19 @@ def test_database():
     }
 
     try:
-        if db is not None:
+        if database.db is not None:
             response["database"] = "✅ Available"
             try:
-                response["collections"] = db.list_collection_names()
+                # Connectivity is always checked live; only the collection listing is cached
+                collections = _collections_cache.get("names")
+                if collections is None:
+                    collections = await database.db.list_collection_names()
+                    _collections_cache["names"] = collections
+                    response["collections_cached"] = False
+                else:
+                    await database.db.command("ping")
+                    response["collections_cached"] = True
+                response["collections"] = collections
                 response["database"] = "✅ Connected & Working"
                 response["connection_status"] = "Connected"
             except Exception as e:
@@ -69,16 +170,14 @@ def test_database():
 # -----------------------------
 @app.post("/api/teams", response_model=IdResponse)
 async def create_team(team: Team):
-    new_id = create_document("team", team)
+    new_id = await create_document("team", team)
     return {"id": new_id}
 
 
 @app.get("/api/teams")
 async def list_teams():
-    docs = get_documents("team")
-    for d in docs:
-        d["id"] = str(d.pop("_id"))
-    return docs
+    docs = await get_documents("team")
+    return ORJSONResponse(stringify_ids(docs))
 
 
 # -----------------------------
@@ -88,19 +187,18 @@ async def list_teams():
 async def create_tournament(tournament: Tournament):
     # Validate team ids exist (basic check)
     if tournament.team_ids:
-        count = db["team"].count_documents({"_id": {"$in": [oid(t) for t in tournament.team_ids]}})
-        if count != len(tournament.team_ids):
+        ids = oids(tournament.team_ids)
+        found = await database.teams.distinct("_id", {"_id": {"$in": ids}})
+        if len(found) != len(ids):
             raise HTTPException(status_code=400, detail="One or more team ids are invalid")
-    new_id = create_document("tournament", tournament)
+    new_id = await create_document("tournament", tournament)
     return {"id": new_id}
 
 
 @app.get("/api/tournaments")
 async def list_tournaments():
-    docs = get_documents("tournament")
-    for d in docs:
-        d["id"] = str(d.pop("_id"))
-    return docs
+    docs = await get_documents("tournament")
+    return ORJSONResponse(stringify_ids(docs))
 
 
 # -----------------------------
@@ -110,46 +208,55 @@ class GenerateScheduleRequest(BaseModel):
     tournament_id: str
 
 
-def round_robin_pairings(team_ids: List[str]) -> List[tuple]:
-    teams = team_ids.copy()
-    if len(teams) % 2 == 1:
-        teams.append("BYE")
-    n = len(teams)
-    rounds = n - 1
+@lru_cache(maxsize=64)
+def _round_robin_indices(count: int) -> Tuple[Tuple[int, int], ...]:
+    # Circle method over team indices: slot 0 stays fixed and the other n - 1
+    # slots rotate one step per round. An odd field gets a BYE at index n - 1.
+    if count < 2:
+        return ()
+    n = count + count % 2
     half = n // 2
-    schedule = []
-    for r in range(rounds):
-        pairings = []
-        for i in range(half):
-            a = teams[i]
-            b = teams[n - 1 - i]
-            if a != "BYE" and b != "BYE":
-                pairings.append((a, b))
-        schedule.append(pairings)
-        # rotate
-        teams = [teams[0]] + [teams[-1]] + teams[1:-1]
-    return [match for round_ in schedule for match in round_]
+    rounds = np.arange(n - 1)[:, None]
+    rot = np.zeros((n - 1, n), dtype=np.intp)
+    rot[:, 1:] = 1 + (np.arange(n - 1)[None, :] - rounds) % (n - 1)
+    home = rot[:, :half]
+    away = rot[:, :half - 1:-1]
+    # Drop BYE pairings; boolean indexing keeps round order
+    keep = (home < count) & (away < count)
+    return tuple(zip(home[keep].tolist(), away[keep].tolist()))
+
+
+def round_robin_pairings(team_ids: List[str]) -> List[tuple]:
+    # The index pattern depends only on the number of teams
+    return [(team_ids[h], team_ids[a]) for h, a in _round_robin_indices(len(team_ids))]
 
 
 @app.post("/api/tournaments/generate_schedule")
 async def generate_schedule(payload: GenerateScheduleRequest):
-    t = db["tournament"].find_one({"_id": oid(payload.tournament_id)})
+    t = await database.tournaments.find_one({"_id": oid(payload.tournament_id)})
     if not t:
         raise HTTPException(status_code=404, detail="Tournament not found")
     team_ids = [str(x) for x in t.get("team_ids", [])]
     if len(team_ids) < 2:
         raise HTTPException(status_code=400, detail="At least two teams required")
 
-    created = []
-    for home_id, away_id in round_robin_pairings(team_ids):
-        match = Match(
-            tournament_id=payload.tournament_id,
-            home_team_id=home_id,
-            away_team_id=away_id,
-            status="scheduled",
-        )
-        new_id = create_document("match", match)
-        created.append(new_id)
+    # Same fields as Match.model_dump(); the ids come from the stored tournament,
+    # so there is nothing left for Pydantic to validate per pairing.
+    matches = [
+        {
+            "tournament_id": payload.tournament_id,
+            "home_team_id": home_id,
+            "away_team_id": away_id,
+            "scheduled_date": None,
+            "status": "scheduled",
+            "home_score": None,
+            "away_score": None,
+        }
+        for home_id, away_id in round_robin_pairings(team_ids)
+    ]
+    # Standings rows must exist before any match can be scored, so every $inc has a target
+    await ensure_standings(payload.tournament_id)
+    created = await create_documents("match", matches)
     return {"created_match_ids": created}
 
 
@@ -164,68 +271,279 @@ class UpdateScoreRequest(BaseModel):
 
 @app.get("/api/tournaments/{tournament_id}/matches")
 async def list_matches(tournament_id: str):
-    docs = get_documents("match", {"tournament_id": tournament_id})
-    for d in docs:
-        d["id"] = str(d.pop("_id"))
-    return docs
+    async def fetch():
+        # score_write/standings_synced are standings bookkeeping, not part of the API
+        docs = await database.matches.find(
+            {"tournament_id": tournament_id}, {"score_write": 0, "standings_synced": 0}
+        ).to_list(length=None)
+        return stringify_ids(docs)
+
+    return ORJSONResponse(await coalesce(("matches", tournament_id), fetch))
+
+
+async def record_score(match_oid: ObjectId, home_score: int, away_score: int) -> Optional[dict]:
+    """Mark a match completed with the given score and fold it into the standings.
+
+    Returns the match as it was before, or None if it does not exist.
+    """
+    # Every score write carries a fresh token and leaves the match unsynced until its
+    # standings change is known to have landed (see the standings section below).
+    token = str(ObjectId())
+    before = await database.matches.find_one_and_update(
+        {"_id": match_oid},
+        {"$set": {
+            "status": "completed",
+            "home_score": home_score,
+            "away_score": away_score,
+            "score_write": token,
+            "standings_synced": False,
+        }},
+        return_document=ReturnDocument.BEFORE,
+    )
+    if before is None:
+        return None
+
+    # Each row takes the change only if it still accounts for the result this write replaced
+    match_id = str(match_oid)
+    home_inc, away_inc = result_change(before, home_score, away_score)
+    result = await database.standings.bulk_write(
+        [
+            UpdateOne(
+                {"tournament_id": before["tournament_id"], "team_id": team_id, f"results.{match_id}": before.get("score_write")},
+                {"$inc": inc, "$set": {f"results.{match_id}": token}},
+            )
+            for team_id, inc in ((before["home_team_id"], home_inc), (before["away_team_id"], away_inc))
+        ],
+        ordered=False,
+    )
+    if result.matched_count == 2:
+        await database.matches.update_one({"_id": match_oid, "score_write": token}, {"$set": {"standings_synced": True}})
+    return before
 
 
 @app.post("/api/matches/update_score")
 async def update_score(payload: UpdateScoreRequest):
-    m = db["match"].find_one({"_id": oid(payload.match_id)})
-    if not m:
+    m = await record_score(oid(payload.match_id), payload.home_score, payload.away_score)
+    if m is None:
         raise HTTPException(status_code=404, detail="Match not found")
-    db["match"].update_one(
-        {"_id": oid(payload.match_id)},
-        {"$set": {"status": "completed", "home_score": payload.home_score, "away_score": payload.away_score}},
-    )
     return {"ok": True}
 
 
+@app.post("/api/matches/bulk_update_score")
+async def bulk_update_score(payload: List[UpdateScoreRequest]):
+    if not payload:
+        return {"ok": True, "updated": 0}
+
+    # A match listed more than once ends on its last score
+    scores = {p.match_id: (p.home_score, p.away_score) for p in payload}
+    match_ids = list(scores)
+    ids = oids(match_ids)
+    found = {str(_id) for _id in await database.matches.distinct("_id", {"_id": {"$in": ids}})}
+    missing = [match_id for match_id in match_ids if match_id not in found]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Match not found: {', '.join(missing)}")
+
+    # Each match is recorded atomically like update_score, concurrently
+    before = await asyncio.gather(*(record_score(_id, *scores[match_id]) for match_id, _id in zip(match_ids, ids)))
+    return {"ok": True, "updated": sum(m is not None for m in before)}
+
+
 # -----------------------------
 # Standings for round-robin
 # -----------------------------
-@app.get("/api/tournaments/{tournament_id}/standings")
-async def standings(tournament_id: str):
-    # Initialize table
-    team_docs = list(db["team"].find({"_id": {"$in": [oid(t) for t in db["tournament"].find_one({"_id": oid(tournament_id)})["team_ids"]]}}))
-    team_map = {str(t["_id"]): {"team_id": str(t["_id"]), "name": t.get("name"), "played": 0, "won": 0, "drawn": 0, "lost": 0, "gf": 0, "ga": 0, "gd": 0, "points": 0} for t in team_docs}
-
-    matches = list(db["match"].find({"tournament_id": tournament_id, "status": "completed"}))
+# Rows live in the "standings" collection, one per (tournament_id, team_id), and are
+# kept current by record_score. Each row's "results" maps match id -> the score_write
+# token of the result it accounts for, so a change is applied at most once and only on
+# top of the result it replaces. A match stays standings_synced=False until both of its
+# rows took the change; any unsynced match (a lost race, a crash between the two writes)
+# makes the next read rebuild the tournament's rows from the match history.
+# team_id breaks ties so tied teams keep a stable order between polls.
+STANDINGS_SORT = [("points", -1), ("gd", -1), ("gf", -1), ("team_id", 1)]
+STANDINGS_STATS = ("played", "won", "drawn", "lost", "gf", "ga", "gd", "points")
+
+
+def result_increments(home_score: int, away_score: int, sign: int = 1) -> Tuple[dict, dict]:
+    """$inc documents for the home and away standings rows of a single result"""
+    if home_score > away_score:
+        home_pts, away_pts = 3, 0
+    elif home_score < away_score:
+        home_pts, away_pts = 0, 3
+    else:
+        home_pts, away_pts = 1, 1
+
+    def row(gf: int, ga: int, pts: int) -> dict:
+        return {
+            "played": sign,
+            "won": sign * (pts == 3),
+            "drawn": sign * (pts == 1),
+            "lost": sign * (pts == 0),
+            "gf": sign * gf,
+            "ga": sign * ga,
+            "gd": sign * (gf - ga),
+            "points": sign * pts,
+        }
+
+    return row(home_score, away_score, home_pts), row(away_score, home_score, away_pts)
+
+
+def result_change(match: dict, home_score: int, away_score: int) -> Tuple[dict, dict]:
+    """$inc documents for the home and away rows when a match is (re-)scored"""
+    home_inc, away_inc = result_increments(home_score, away_score)
+    if match.get("status") == "completed":
+        old_home, old_away = result_increments(int(match.get("home_score") or 0), int(match.get("away_score") or 0), sign=-1)
+        home_inc = {k: v + old_home[k] for k, v in home_inc.items()}
+        away_inc = {k: v + old_away[k] for k, v in away_inc.items()}
+    return home_inc, away_inc
+
+
+async def compute_standings(tournament_id: str) -> Tuple[List[dict], Dict[str, Optional[str]]]:
+    """Build the standings table from scratch out of the completed matches.
+
+    Also returns the score_write token of every completed match the table was built from.
+    """
+    # Tournament, its teams and its completed matches in a single round-trip.
+    # team_ids are stored as strings, so convert them before joining on team._id
+    # ($toObjectId passes ids that are already ObjectIds through unchanged).
+    # A plain localField/foreignField join keeps the lookup on the team _id index
+    # (and, without a sub-pipeline, works on servers older than MongoDB 5.0).
+    pipeline = [
+        {"$match": {"_id": oid(tournament_id)}},
+        {"$addFields": {"team_oids": {"$map": {"input": {"$ifNull": ["$team_ids", []]}, "in": {"$toObjectId": "$$this"}}}}},
+        {"$lookup": {"from": "team", "localField": "team_oids", "foreignField": "_id", "as": "teams"}},
+        # Matches store the tournament id as the same string we were given, so match on it
+        # directly instead of converting $_id per document; this also hits the match index.
+        {"$lookup": {
+            "from": "match",
+            "pipeline": [
+                {"$match": {"tournament_id": tournament_id, "status": "completed"}},
+                {"$project": {"home_team_id": 1, "away_team_id": 1, "home_score": 1, "away_score": 1, "score_write": 1}},
+            ],
+            "as": "matches",
+        }},
+        {"$project": {"_id": 0, "teams._id": 1, "teams.name": 1, "matches": 1}},
+    ]
+    docs = await database.tournaments.aggregate(pipeline).to_list(length=1)
+    if not docs:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+    doc = docs[0]
+
+    # Ordered by id so the stable lexsort below breaks ties on team_id, like STANDINGS_SORT
+    teams = sorted(doc["teams"], key=lambda t: str(t["_id"]))
+    team_index = {str(t["_id"]): i for i, t in enumerate(teams)}
+    tokens = {str(m["_id"]): m.get("score_write") for m in doc["matches"]}
+    matches = [m for m in doc["matches"] if m["home_team_id"] in team_index and m["away_team_id"] in team_index]
+    results = [{} for _ in teams]
     for m in matches:
-        h = team_map.get(m["home_team_id"])
-        a = team_map.get(m["away_team_id"])
-        if not h or not a:
-            continue
-        hs = int(m.get("home_score", 0))
-        as_ = int(m.get("away_score", 0))
-        h["played"] += 1
-        a["played"] += 1
-        h["gf"] += hs
-        h["ga"] += as_
-        a["gf"] += as_
-        a["ga"] += hs
-        h["gd"] = h["gf"] - h["ga"]
-        a["gd"] = a["gf"] - a["ga"]
-        if hs > as_:
-            h["won"] += 1
-            a["lost"] += 1
-            h["points"] += 3
-        elif hs < as_:
-            a["won"] += 1
-            h["lost"] += 1
-            a["points"] += 3
-        else:
-            h["drawn"] += 1
-            a["drawn"] += 1
-            h["points"] += 1
-            a["points"] += 1
-
-    table = list(team_map.values())
-    table.sort(key=lambda x: (x["points"], x["gd"], x["gf"]), reverse=True)
+        if m.get("score_write"):
+            results[team_index[m["home_team_id"]]][str(m["_id"])] = m["score_write"]
+            results[team_index[m["away_team_id"]]][str(m["_id"])] = m["score_write"]
+    count = len(matches)
+    hi = np.fromiter((team_index[m["home_team_id"]] for m in matches), dtype=np.intp, count=count)
+    ai = np.fromiter((team_index[m["away_team_id"]] for m in matches), dtype=np.intp, count=count)
+    hs = np.fromiter((int(m.get("home_score") or 0) for m in matches), dtype=np.int64, count=count)
+    as_ = np.fromiter((int(m.get("away_score") or 0) for m in matches), dtype=np.int64, count=count)
+    home_win = hs > as_
+    away_win = hs < as_
+    draw = hs == as_
+
+    # Scatter-add every result into per-team columns
+    size = len(teams)
+    played, won, drawn, lost, gf, ga = (np.zeros(size, dtype=np.int64) for _ in range(6))
+    np.add.at(played, hi, 1)
+    np.add.at(played, ai, 1)
+    np.add.at(gf, hi, hs)
+    np.add.at(gf, ai, as_)
+    np.add.at(ga, hi, as_)
+    np.add.at(ga, ai, hs)
+    np.add.at(won, hi[home_win], 1)
+    np.add.at(won, ai[away_win], 1)
+    np.add.at(lost, hi[away_win], 1)
+    np.add.at(lost, ai[home_win], 1)
+    np.add.at(drawn, hi[draw], 1)
+    np.add.at(drawn, ai[draw], 1)
+    gd = gf - ga
+    points = 3 * won + drawn
+
+    # Points, then goal difference, then goals for (lexsort's last key is primary), then team_id
+    order = np.lexsort((-gf, -gd, -points))
+    columns = {"played": played, "won": won, "drawn": drawn, "lost": lost, "gf": gf, "ga": ga, "gd": gd, "points": points}
+    columns = {k: v[order].tolist() for k, v in columns.items()}
+    table = [
+        {
+            "team_id": str(teams[t]["_id"]),
+            "name": teams[t].get("name"),
+            **{k: v[row] for k, v in columns.items()},
+            "results": results[t],
+        }
+        for row, t in enumerate(order.tolist())
+    ]
+    return table, tokens
+
+
+async def reconcile_standings(tournament_id: str, attempts: int = 3):
+    """Rebuild a tournament's standings rows from its match history"""
+    for _ in range(attempts):
+        table, tokens = await compute_standings(tournament_id)
+        now = datetime.now(timezone.utc)
+        if table:
+            await database.standings.bulk_write(
+                [
+                    UpdateOne(
+                        {"tournament_id": tournament_id, "team_id": row["team_id"]},
+                        {
+                            "$set": {**{k: row[k] for k in (*STANDINGS_STATS, "results")}, "reconciled_at": now},
+                            "$setOnInsert": {"name": row["name"]},
+                        },
+                        upsert=True,
+                    )
+                    for row in table
+                ],
+                ordered=False,
+            )
+        # A score written while we rebuilt may have had its change overwritten above;
+        # only when no match moved on can the snapshot's results be marked synced.
+        current = await database.matches.find(
+            {"tournament_id": tournament_id, "status": "completed"}, {"score_write": 1}
+        ).to_list(length=None)
+        if {str(m["_id"]): m.get("score_write") for m in current} == tokens:
+            await database.matches.update_many(
+                {"tournament_id": tournament_id, "standings_synced": False, "score_write": {"$in": [t for t in tokens.values() if t]}},
+                {"$set": {"standings_synced": True}},
+            )
+            return
+
+
+async def ensure_standings(tournament_id: str):
+    """Create a tournament's standings rows from its match history if it has none yet"""
+    if not await database.standings.find_one({"tournament_id": tournament_id}, {"_id": 1}):
+        await reconcile_standings(tournament_id)
+
+
+async def read_standings(tournament_id: str) -> List[dict]:
+    return await database.standings.find(
+        {"tournament_id": tournament_id}, {"_id": 0, "tournament_id": 0, "results": 0}
+    ).sort(STANDINGS_SORT).to_list(length=None)
+
+
+async def load_standings(tournament_id: str) -> List[dict]:
+    table = await read_standings(tournament_id)
+    # Rows never rebuilt (no reconciled_at) predate the results bookkeeping and can't be trusted
+    unsynced = any("reconciled_at" not in row for row in table) or await database.matches.find_one(
+        {"tournament_id": tournament_id, "standings_synced": False}, {"_id": 1}
+    )
+    if not table or unsynced:
+        await reconcile_standings(tournament_id)
+        table = await read_standings(tournament_id)
+    for row in table:
+        row.pop("reconciled_at", None)
     return table
 
 
+@app.get("/api/tournaments/{tournament_id}/standings")
+async def standings(tournament_id: str):
+    return await coalesce(("standings", tournament_id), lambda: load_standings(tournament_id))
+
+
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv("PORT", 8000))